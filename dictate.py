@@ -5,38 +5,157 @@ Uses RealtimeSTT with faster-whisper backend for real-time speech-to-text
 FIXED: Proper Ctrl+C handling and signal management
 """
 
+import os
 import sys
+import atexit
+import logging
 import signal
 import argparse
+import platform
+import select
+import socket
+import subprocess
+import threading
 from pathlib import Path
 
+# Unix socket used by --daemon / --client
+SOCKET_PATH = Path.home() / ".cache" / "voice-dictation" / "sock"
+
+# CTranslate2 compute types that need a CUDA device
+GPU_COMPUTE_TYPES = ("int8_float16", "float16")
+
+logger = logging.getLogger("dictate")
+
 # Global flag for graceful shutdown
 shutdown_requested = False
 
+# Recorder to interrupt when a shutdown signal arrives
+active_recorder = None
+
 def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
+    """Handle Ctrl+C / SIGTERM gracefully"""
     global shutdown_requested
-    print("\n\n⏹️  Stopping... (press Ctrl+C again to force quit)")
+
+    if shutdown_requested:
+        # Second Ctrl+C: stop waiting for a clean shutdown
+        raise KeyboardInterrupt
+
+    logger.info("\n\n⏹️  Stopping... (press Ctrl+C again to force quit)")
     shutdown_requested = True
-    sys.exit(0)
 
-# Register signal handler
+    # Unblock recorder.text() so the main loop sees the flag. abort() waits
+    # for text() to acknowledge, and text() runs on this (main) thread, so
+    # it has to be called from another thread.
+    if active_recorder is not None:
+        threading.Thread(target=active_recorder.abort, daemon=True).start()
+
+# Register signal handlers
 signal.signal(signal.SIGINT, signal_handler)
+signal.signal(signal.SIGTERM, signal_handler)
+
 
-try:
-    from RealtimeSTT import AudioToTextRecorder
-    import pyperclip
-except ImportError as e:
-    print(f"❌ Error: Missing dependency: {e}")
-    print("\n💡 Please run: ./install.sh")
-    print("   Or manually: pip install -r requirements.txt")
+def _missing_dependency(e):
+    """Report a missing dependency and exit"""
+    logger.error(f"❌ Error: Missing dependency: {e}")
+    logger.error("\n💡 Please run: ./install.sh")
+    logger.error("   Or manually: pip install -r requirements.txt")
     sys.exit(1)
 
 
+def _select_compute_type():
+    """
+    Pick the fastest safe compute type for this CPU
+
+    int8 is only faster than float32 when the CPU has vectorized int8 GEMM
+    support (AVX2 / AVX512-VNNI on x86, NEON on ARM). Without it CTranslate2
+    falls back to a scalar path that can be several times slower.
+
+    Returns:
+        "int8" or "float32"
+    """
+    machine = platform.machine().lower()
+    if machine in ("arm64", "aarch64"):
+        return "int8"
+
+    flags = set()
+    try:
+        if sys.platform.startswith("linux"):
+            for line in Path("/proc/cpuinfo").read_text().splitlines():
+                if line.startswith("flags"):
+                    flags.update(line.split(":", 1)[1].split())
+                    break
+        elif sys.platform == "darwin":
+            for key in ("machdep.cpu.features", "machdep.cpu.leaf7_features"):
+                result = subprocess.run(
+                    ["sysctl", "-n", key], capture_output=True, text=True
+                )
+                flags.update(result.stdout.lower().split())
+    except Exception:
+        pass
+
+    if "avx512_vnni" in flags or "avx2" in flags:
+        return "int8"
+    return "float32"
+
+
+def _select_device():
+    """
+    Pick the inference device: CUDA if torch can see a GPU, else CPU
+
+    Returns:
+        "cuda" or "cpu"
+    """
+    try:
+        import torch  # Already loaded by RealtimeSTT
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except Exception:
+        return "cpu"
+
+
+def _output_text(text, output_mode):
+    """Print or copy transcribed text according to output_mode"""
+    if output_mode == "print":
+        print(f"\n📝 Transcribed: {text}")
+    elif output_mode == "clipboard":
+        import pyperclip  # Availability checked in main() before listening
+        pyperclip.copy(text)
+        logger.info(f"\n📋 Copied to clipboard: {text}")
+
+
+def request_transcription(socket_path=SOCKET_PATH):
+    """
+    Ask a running --daemon instance for one transcription
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+
+    Returns:
+        Transcribed text string, or None if no daemon is listening.
+        Exits if the socket exists but can't be used (e.g. permissions).
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            chunks = []
+            while True:
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except OSError as e:
+        logger.error(f"❌ Error: Cannot talk to daemon on {socket_path}: {e}")
+        sys.exit(1)
+
+    return b"".join(chunks).decode("utf-8")
+
+
 class VoiceDictation:
     """Real-time voice dictation using RealtimeSTT"""
 
-    def __init__(self, model="base.en", language="en", enable_realtime=True):
+    def __init__(self, model="base.en", language="en", enable_realtime=True,
+                 compute_type="auto", device="auto"):
         """
         Initialize voice dictation
 
@@ -44,21 +163,68 @@ class VoiceDictation:
             model: Whisper model size (tiny.en, base.en, small.en, medium.en)
             language: Language code (en, es, fr, etc.)
             enable_realtime: Enable real-time transcription (faster feedback)
+            compute_type: CTranslate2 compute type (auto, int8, int8_float16, float16, float32)
+            device: Inference device (auto, cuda, cpu)
         """
         self.model = model
         self.language = language
+        self.device = device
+        self.compute_type = compute_type
         self.recorder = None
+        self._shutdown_done = False
+
+        logger.info(f"🔧 Initializing voice dictation...")
+        logger.info(f"   Model: {model}")
+        logger.info(f"   Language: {language}")
+        logger.info(f"   Device: {device}")
+        logger.info(f"   Compute type: {compute_type}")
+        logger.info(f"   Real-time: {enable_realtime}")
+        logger.info(f"   Press Ctrl+C to stop anytime")
+
+        # Give the inference kernels half the cores so they don't fight the
+        # audio/VAD threads for CPU time (respected by CTranslate2)
+        os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+
+        # Load the model in the background so startup (argument handling,
+        # socket setup, Ctrl+C) isn't stuck behind it. Callers wait for it
+        # with _ensure_ready() right before they need the recorder.
+        self._init_error = None
+        self._init_thread = threading.Thread(
+            target=self._build_recorder,
+            args=(model, language, enable_realtime, compute_type, device),
+            daemon=True
+        )
+        self._init_thread.start()
+
+        # Single cleanup point for every exit path (normal return, Ctrl+C, errors)
+        atexit.register(self._shutdown)
 
-        print(f"🔧 Initializing voice dictation...")
-        print(f"   Model: {model}")
-        print(f"   Language: {language}")
-        print(f"   Real-time: {enable_realtime}")
-        print(f"   Press Ctrl+C to stop anytime")
+    def _build_recorder(self, model, language, enable_realtime, compute_type, device):
+        """Create the recorder and load the model (runs in _init_thread)"""
+        global active_recorder
 
         try:
+            # Imported here rather than at module level: RealtimeSTT pulls in
+            # torch and ctranslate2, which takes most of a second
+            from RealtimeSTT import AudioToTextRecorder
+
+            # Resolved here since detecting CUDA needs torch
+            if device == "auto":
+                device = _select_device()
+            if compute_type == "auto":
+                compute_type = "int8_float16" if device == "cuda" else _select_compute_type()
+            elif device == "cpu" and compute_type in GPU_COMPUTE_TYPES:
+                fallback = _select_compute_type()
+                logger.warning(f"⚠️  {compute_type} needs a GPU, using {fallback} on CPU")
+                compute_type = fallback
+            self.device = device
+            self.compute_type = compute_type
+
             self.recorder = AudioToTextRecorder(
                 model=model,
                 language=language,
+                device=device,
+                compute_type=compute_type,
                 enable_realtime_transcription=enable_realtime,
                 silero_sensitivity=0.5,
                 webrtc_sensitivity=3,
@@ -67,22 +233,48 @@ class VoiceDictation:
                 min_gap_between_recordings=0.1,
                 spinner=False,  # Disable spinner for better Ctrl+C handling
             )
-            print("✓ Voice dictation ready!")
+            active_recorder = self.recorder
+            logger.info(f"✓ Voice dictation ready! ({device}, {compute_type})")
         except Exception as e:
-            print(f"❌ Error initializing recorder: {e}")
-            print("\n💡 Common issues:")
-            print("   - No microphone detected")
-            print("   - Permission denied (check audio settings)")
-            print("   - Missing system dependencies (run install.sh)")
+            self._init_error = e
+
+    def _ensure_ready(self):
+        """
+        Wait for the background model load to finish
+
+        Returns:
+            True once the recorder is ready, False if shutdown was requested
+            while waiting. Exits if the recorder failed to initialize.
+        """
+        # Join in short slices so Ctrl+C isn't stuck behind the model load
+        while self._init_thread.is_alive():
+            self._init_thread.join(0.1)
+            if shutdown_requested:
+                return False
+
+        if isinstance(self._init_error, ImportError):
+            _missing_dependency(self._init_error)
+
+        if self._init_error is not None:
+            logger.error(f"❌ Error initializing recorder: {self._init_error}")
+            logger.error("\n💡 Common issues:")
+            logger.error("   - No microphone detected")
+            logger.error("   - Permission denied (check audio settings)")
+            logger.error("   - Missing system dependencies (run install.sh)")
             sys.exit(1)
 
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        if self.recorder:
-            try:
-                self.recorder.shutdown()
-            except:
-                pass
+        return True
+
+    def _shutdown(self):
+        """Shut down the recorder (safe to call more than once)"""
+        if self._shutdown_done or not self.recorder:
+            return
+        self._shutdown_done = True
+
+        try:
+            self.recorder.shutdown()
+        except Exception as e:
+            logger.warning(f"⚠️  Error shutting down recorder: {e}")
 
     def listen_once(self, output_mode="print"):
         """
@@ -96,10 +288,10 @@ class VoiceDictation:
         """
         global shutdown_requested
 
-        if shutdown_requested:
+        if shutdown_requested or not self._ensure_ready():
             return ""
 
-        print("\n🎤 Listening... (speak now, Ctrl+C to stop)")
+        logger.info("\n🎤 Listening... (speak now, Ctrl+C to stop)")
 
         try:
             # This blocks until speech is detected and ends
@@ -109,24 +301,20 @@ class VoiceDictation:
                 return ""
 
             if not text or not text.strip():
-                print("⚠️  No speech detected")
+                logger.warning("⚠️  No speech detected")
                 return ""
 
             # Handle output based on mode
-            if output_mode == "print":
-                print(f"\n📝 Transcribed: {text}")
-            elif output_mode == "clipboard":
-                pyperclip.copy(text)
-                print(f"\n📋 Copied to clipboard: {text}")
+            _output_text(text, output_mode)
 
             return text
 
         except KeyboardInterrupt:
-            print("\n\n⏹️  Stopped by user")
+            logger.info("\n\n⏹️  Stopped by user")
             return ""
         except Exception as e:
             if not shutdown_requested:
-                print(f"\n❌ Error during transcription: {e}")
+                logger.error(f"\n❌ Error during transcription: {e}")
             return ""
 
     def listen_continuous(self, output_mode="print"):
@@ -138,10 +326,10 @@ class VoiceDictation:
         """
         global shutdown_requested
 
-        print("\n🎤 Continuous listening mode")
-        print("   Press Ctrl+C to stop")
-        print("   Speak naturally, pause to finish each phrase")
-        print("")
+        logger.info("\n🎤 Continuous listening mode")
+        logger.info("   Press Ctrl+C to stop")
+        logger.info("   Speak naturally, pause to finish each phrase")
+        logger.info("")
 
         try:
             while not shutdown_requested:
@@ -150,35 +338,98 @@ class VoiceDictation:
                     print("")  # Empty line for readability
 
         except KeyboardInterrupt:
-            print("\n\n⏹️  Stopped continuous mode")
-        finally:
-            if self.recorder:
+            logger.info("\n\n⏹️  Stopped continuous mode")
+
+    def serve(self, socket_path=SOCKET_PATH):
+        """
+        Serve transcriptions over a Unix socket until Ctrl+C
+
+        Keeps the model loaded between requests, so each client only pays
+        for listening and transcription, not for model loading.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+        """
+        global shutdown_requested
+
+        socket_path = Path(socket_path)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            # Only remove the socket if nothing answers on it; a live daemon
+            # keeps it
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(str(socket_path))
+            except ConnectionRefusedError:
+                socket_path.unlink()  # Stale socket from a previous run
+            else:
+                logger.error(f"❌ Error: Daemon already running on {socket_path}")
+                sys.exit(1)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # accept() is retried after a signal, so wake up periodically to
+        # check shutdown_requested
+        server.settimeout(0.5)
+        try:
+            server.bind(str(socket_path))
+            os.chmod(socket_path, 0o600)
+            server.listen(1)
+
+            logger.info(f"\n🎤 Daemon mode: listening on {socket_path}")
+            logger.info("   Run with --client to dictate")
+            logger.info("   Press Ctrl+C to stop")
+
+            while not shutdown_requested:
                 try:
-                    self.recorder.shutdown()
-                except:
-                    pass
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    # Clients never send anything, so a readable connection
+                    # has already been closed (e.g. another daemon's probe)
+                    if select.select([conn], [], [], 0)[0]:
+                        continue
+                    text = self.listen_once("return")
+                    try:
+                        conn.sendall(text.encode("utf-8"))
+                    except OSError:
+                        pass  # Client went away
+
+        except KeyboardInterrupt:
+            logger.info("\n\n⏹️  Stopped daemon")
+        finally:
+            server.close()
+            if socket_path.exists():
+                socket_path.unlink()
 
     def test_microphone(self):
         """Test if microphone is working"""
-        print("\n🎤 Testing microphone...")
-        print("   Speak for a few seconds... (Ctrl+C to cancel)")
+        if not self._ensure_ready():
+            logger.info("\n\n⏹️  Test cancelled")
+            return False
+
+        logger.info("\n🎤 Testing microphone...")
+        logger.info("   Speak for a few seconds... (Ctrl+C to cancel)")
 
         try:
             text = self.recorder.text()
+            if shutdown_requested:
+                logger.info("\n\n⏹️  Test cancelled")
+                return False
             if text:
-                print(f"\n✓ Microphone working! Heard: '{text}'")
+                logger.info(f"\n✓ Microphone working! Heard: '{text}'")
                 return True
             else:
-                print("\n⚠️  No audio detected. Check:")
-                print("   1. Microphone is connected and enabled")
-                print("   2. Correct audio input device selected")
-                print("   3. Microphone permissions granted")
+                logger.warning("\n⚠️  No audio detected. Check:")
+                logger.warning("   1. Microphone is connected and enabled")
+                logger.warning("   2. Correct audio input device selected")
+                logger.warning("   3. Microphone permissions granted")
                 return False
         except KeyboardInterrupt:
-            print("\n\n⏹️  Test cancelled")
+            logger.info("\n\n⏹️  Test cancelled")
             return False
         except Exception as e:
-            print(f"\n❌ Microphone test failed: {e}")
+            logger.error(f"\n❌ Microphone test failed: {e}")
             return False
 
 
@@ -204,6 +455,12 @@ Examples:
   # Test microphone
   python dictate-fixed.py --test-mic
 
+  # Keep the model loaded in the background...
+  python dictate-fixed.py --daemon
+
+  # ...and dictate through it without reloading the model
+  python dictate-fixed.py --client --clipboard
+
 Models (speed vs accuracy):
   - tiny.en   : Fastest, lowest accuracy
   - base.en   : Balanced (default)
@@ -221,6 +478,20 @@ Note: Press Ctrl+C ONCE to stop gracefully
         help='Whisper model size (default: base.en)'
     )
 
+    parser.add_argument(
+        '--compute-type',
+        default='auto',
+        choices=['auto', 'int8', 'int8_float16', 'float16', 'float32'],
+        help='Model compute type (default: auto - int8_float16 on GPU; int8 if the CPU supports it, else float32)'
+    )
+
+    parser.add_argument(
+        '--device',
+        default='auto',
+        choices=['auto', 'cuda', 'cpu'],
+        help='Inference device (default: auto - cuda if available, else cpu)'
+    )
+
     parser.add_argument(
         '--language',
         default='en',
@@ -251,20 +522,93 @@ Note: Press Ctrl+C ONCE to stop gracefully
         help='Disable real-time transcription (wait for full audio)'
     )
 
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help=f'Keep the model loaded and serve dictation requests on {SOCKET_PATH}'
+    )
+
+    parser.add_argument(
+        '--client',
+        action='store_true',
+        help='Dictate through a running --daemon instead of loading the model'
+    )
+
+    verbosity = parser.add_mutually_exclusive_group()
+
+    verbosity.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only show warnings, errors and the transcribed text'
+    )
+
+    verbosity.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show debug messages'
+    )
+
     args = parser.parse_args()
 
+    if args.device == 'cpu' and args.compute_type in GPU_COMPUTE_TYPES:
+        parser.error(f"--compute-type {args.compute_type} requires --device cuda or auto")
+
+    # Status messages go to stderr; transcriptions stay on stdout.
+    # Library loggers stay at WARNING unless --verbose is given.
+    if args.quiet:
+        log_level = logging.WARNING
+    elif args.verbose:
+        log_level = logging.DEBUG
+    else:
+        log_level = logging.INFO
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
+    logger.setLevel(log_level)
+
     # Determine output mode
     output_mode = "clipboard" if args.clipboard else "print"
 
+    # Fail before listening, not after the user has dictated
+    if output_mode == "clipboard":
+        try:
+            import pyperclip  # noqa: F401
+        except ImportError as e:
+            _missing_dependency(e)
+
+    # Client mode: let the daemon listen and transcribe
+    if args.client:
+        # Nothing to clean up locally, so let Ctrl+C / kill interrupt
+        # immediately instead of waiting in recv() for the daemon
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            text = request_transcription()
+        except KeyboardInterrupt:
+            logger.info("\n\n⏹️  Cancelled")
+            sys.exit(0)
+        if text is None:
+            logger.error(f"❌ Error: No daemon listening on {SOCKET_PATH}")
+            logger.error("\n💡 Start one with: python dictate.py --daemon")
+            sys.exit(1)
+        if not text.strip():
+            logger.warning("⚠️  No speech detected")
+            sys.exit(1)
+        _output_text(text, output_mode)
+        sys.exit(0)
+
     # Initialize dictation
     try:
         dictation = VoiceDictation(
             model=args.model,
             language=args.language,
-            enable_realtime=not args.no_realtime
+            enable_realtime=not args.no_realtime,
+            compute_type=args.compute_type,
+            device=args.device
         )
     except KeyboardInterrupt:
-        print("\n\n⏹️  Cancelled during initialization")
+        logger.info("\n\n⏹️  Cancelled during initialization")
         sys.exit(0)
 
     # Test microphone if requested
@@ -273,24 +617,19 @@ Note: Press Ctrl+C ONCE to stop gracefully
             success = dictation.test_microphone()
             sys.exit(0 if success else 1)
         except KeyboardInterrupt:
-            print("\n\n⏹️  Test cancelled")
+            logger.info("\n\n⏹️  Test cancelled")
             sys.exit(0)
 
     # Run dictation
     try:
-        if args.continuous:
+        if args.daemon:
+            dictation.serve()
+        elif args.continuous:
             dictation.listen_continuous(output_mode)
         else:
             dictation.listen_once(output_mode)
     except KeyboardInterrupt:
-        print("\n\n⏹️  Stopped")
-    finally:
-        # Cleanup
-        if dictation and dictation.recorder:
-            try:
-                dictation.recorder.shutdown()
-            except:
-                pass
+        logger.info("\n\n⏹️  Stopped")
 
 
 if __name__ == "__main__":
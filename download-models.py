@@ -4,57 +4,62 @@ Download Whisper models before using voice dictation
 This allows Ctrl+C to work properly in the main dictation script
 """
 
+import os
 import sys
 import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Handle Ctrl+C gracefully
 def signal_handler(sig, frame):
-    print("\n\n⏹️  Download cancelled")
-    sys.exit(0)
+    print("\n\n⏹️  Download cancelled", flush=True)
+    # Exit immediately - parallel download threads can't be interrupted
+    os._exit(0)
 
 signal.signal(signal.SIGINT, signal_handler)
 
-try:
-    from faster_whisper import WhisperModel
-    from huggingface_hub import snapshot_download
-except ImportError as e:
-    print(f"❌ Error: Missing dependency: {e}")
-    print("\n💡 Please run: pip install -r requirements.txt")
-    sys.exit(1)
-
 import argparse
 
 def download_model(model_name, show_progress=True):
     """Download a Whisper model"""
+    import faster_whisper
 
-    print(f"📥 Downloading {model_name} model...")
-    print(f"   This is a one-time download")
-    print(f"   Press Ctrl+C to cancel")
-    print("")
+    if show_progress:
+        print(f"📥 Downloading {model_name} model...")
+        print(f"   This is a one-time download")
+        print(f"   Press Ctrl+C to cancel")
+        print("")
 
-    model_sizes = {
-        'tiny.en': '~75 MB',
-        'base.en': '~150 MB',
-        'small.en': '~500 MB',
-        'medium.en': '~1.5 GB',
-    }
+        model_sizes = {
+            'tiny.en': '~75 MB',
+            'base.en': '~150 MB',
+            'small.en': '~500 MB',
+            'medium.en': '~1.5 GB',
+        }
 
-    print(f"   Size: {model_sizes.get(model_name, 'unknown')}")
-    print(f"   Location: ~/.cache/huggingface/hub/")
-    print("")
+        print(f"   Size: {model_sizes.get(model_name, 'unknown')}")
+        print(f"   Location: ~/.cache/huggingface/hub/")
+        print("")
 
     try:
-        # This will download the model with progress bar
-        print("   Downloading files...")
-        model = WhisperModel(model_name, device="cpu", compute_type="int8")
-        print(f"\n✅ {model_name} model downloaded successfully!")
+        # Only fetch the files into the cache; loading the model would cost
+        # RAM and a CTranslate2 thread pool per (parallel) download
+        if show_progress:
+            print("   Downloading files...")
+        faster_whisper.download_model(model_name)
+        if show_progress:
+            print(f"\n✅ {model_name} model downloaded successfully!")
+        else:
+            print(f"✅ {model_name} done")
         return True
 
     except KeyboardInterrupt:
         print("\n\n⏹️  Download cancelled")
         return False
     except Exception as e:
-        print(f"\n❌ Download failed: {e}")
+        if show_progress:
+            print(f"\n❌ Download failed: {e}")
+        else:
+            print(f"❌ {model_name} failed: {e}")
         return False
 
 
@@ -70,9 +75,12 @@ Examples:
   # Download base model (recommended)
   python download-models.py --model base.en
 
-  # Download all common models
+  # Download all common models (in parallel)
   python download-models.py --all
 
+  # Download all common models one at a time (slow links)
+  python download-models.py --all --serial
+
 Model sizes:
   tiny.en   : ~75 MB  (fastest, lowest accuracy)
   base.en   : ~150 MB (balanced - recommended)
@@ -95,6 +103,12 @@ After downloading, models are cached and won't be downloaded again.
         help='Download all common models (tiny, base, small)'
     )
 
+    parser.add_argument(
+        '--serial',
+        action='store_true',
+        help='With --all, download models one at a time instead of in parallel'
+    )
+
     args = parser.parse_args()
 
     if not args.model and not args.all:
@@ -104,6 +118,16 @@ After downloading, models are cached and won't be downloaded again.
         print("  python download-models.py --all")
         sys.exit(1)
 
+    # Heavy imports are deferred until there is work to do, so --help and
+    # usage errors return immediately
+    try:
+        import faster_whisper  # noqa: F401
+        from huggingface_hub.utils import disable_progress_bars
+    except ImportError as e:
+        print(f"❌ Error: Missing dependency: {e}")
+        print("\n💡 Please run: pip install -r requirements.txt")
+        sys.exit(1)
+
     models_to_download = []
 
     if args.all:
@@ -117,17 +141,36 @@ After downloading, models are cached and won't be downloaded again.
 
     success_count = 0
 
-    for i, model in enumerate(models_to_download, 1):
-        if len(models_to_download) > 1:
-            print(f"[{i}/{len(models_to_download)}] ", end="")
+    if len(models_to_download) > 1 and not args.serial:
+        # Downloads are network-bound, so fetch all models concurrently.
+        # Progress bars from parallel downloads would overwrite each other,
+        # so print one line per model instead.
+        disable_progress_bars()
+        print(f"📥 Downloading {len(models_to_download)} models in parallel...")
+        print(f"   Location: ~/.cache/huggingface/hub/")
+        print(f"   Press Ctrl+C to cancel")
+        print("")
+
+        with ThreadPoolExecutor(max_workers=len(models_to_download)) as executor:
+            futures = [
+                executor.submit(download_model, model, show_progress=False)
+                for model in models_to_download
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+    else:
+        for i, model in enumerate(models_to_download, 1):
+            if len(models_to_download) > 1:
+                print(f"[{i}/{len(models_to_download)}] ", end="")
 
-        if download_model(model):
-            success_count += 1
-        else:
-            break  # Stop on failure or cancellation
+            if download_model(model):
+                success_count += 1
+            else:
+                break  # Stop on failure or cancellation
 
-        if i < len(models_to_download):
-            print("\n" + "-" * 50 + "\n")
+            if i < len(models_to_download):
+                print("\n" + "-" * 50 + "\n")
 
     print("\n" + "=" * 50)
 
@@ -3,104 +3,114 @@
 Generate sound and icon assets for Voice Dictation Daemon
 """
 
+import io
 import wave
-import struct
-import math
 from pathlib import Path
 
+import numpy as np
+
 SCRIPT_DIR = Path(__file__).parent
 
+def _sine(phase):
+    """
+    Evaluate sin() over a phase array in float32
+
+    The phase is wrapped to [0, 2*pi) first so float32 keeps full precision;
+    NumPy then evaluates the contiguous float32 array with its SIMD sin kernel.
+    """
+    wrapped = np.mod(phase, 2 * np.pi).astype(np.float32)
+    return np.sin(wrapped, out=wrapped)
+
+def _fade_envelope(num_samples, fade_frac):
+    """Linear fade-in/fade-out envelope over the first/last fade_frac of samples"""
+    fade_samples = int(num_samples * fade_frac)
+    if fade_samples == 0:
+        return np.ones(num_samples, dtype=np.float32)
+
+    i = np.arange(num_samples, dtype=np.float32)
+    ramp_in = np.minimum(i, fade_samples) / np.float32(fade_samples)
+    ramp_out = np.minimum(num_samples - i, fade_samples) / np.float32(fade_samples)
+    return np.minimum(ramp_in, ramp_out)
+
+def _write_bytes(filename, data):
+    """
+    Write data to filename unless it already has that content
+
+    The data goes to a temporary file that is then renamed over filename,
+    so an interrupted run never leaves a half-written asset behind.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if filename.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    tmp_file = filename.with_name(filename.name + '.tmp')
+    tmp_file.write_bytes(data)
+    tmp_file.replace(filename)
+    return True
+
+def _write_wav(filename, value, volume, sample_rate):
+    """
+    Scale a [-1, 1] waveform by volume and write it as a 16-bit mono WAV
+
+    value is scaled in place.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    # Scale and clip in place, then convert once. Explicit little-endian so
+    # the byte order is correct on any host.
+    np.multiply(value, volume * 32767, out=value)
+    np.clip(value, -32768, 32767, out=value)
+    samples = value.astype('<i2', copy=False)
+
+    # Build the whole file in memory so the header is finalized before
+    # anything touches the disk
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wav:
+        # Mono, 16-bit, with the final frame count so the header written up
+        # front is already correct and needn't be patched on close
+        wav.setparams((1, 2, sample_rate, len(samples), 'NONE', 'not compressed'))
+        wav.writeframes(samples.tobytes())  # All frames in one write
+
+    return _write_bytes(filename, buf.getvalue())
+
 def generate_tone(filename, frequency, duration_ms, volume=0.5, fade=True):
     """Generate a simple tone WAV file"""
     sample_rate = 44100
     num_samples = int(sample_rate * duration_ms / 1000)
 
-    with wave.open(str(filename), 'w') as wav:
-        wav.setnchannels(1)  # Mono
-        wav.setsampwidth(2)  # 16-bit
-        wav.setframerate(sample_rate)
-
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Generate sine wave
-            value = math.sin(2 * math.pi * frequency * t)
-
-            # Apply fade in/out
-            if fade:
-                fade_samples = int(num_samples * 0.1)  # 10% fade
-                if i < fade_samples:
-                    value *= i / fade_samples
-                elif i > num_samples - fade_samples:
-                    value *= (num_samples - i) / fade_samples
-
-            # Apply volume and convert to 16-bit
-            sample = int(value * volume * 32767)
-            wav.writeframes(struct.pack('<h', sample))
-
-def generate_start_sound():
-    """Generate ascending tone for start"""
-    filename = SCRIPT_DIR / 'sounds' / 'start.wav'
-    sample_rate = 44100
-    duration_ms = 200
-    num_samples = int(sample_rate * duration_ms / 1000)
-
-    with wave.open(str(filename), 'w') as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(sample_rate)
-
-        for i in range(num_samples):
-            t = i / sample_rate
-            progress = i / num_samples
-
-            # Ascending frequency (440Hz to 880Hz)
-            frequency = 440 + (880 - 440) * progress
-            value = math.sin(2 * math.pi * frequency * t)
+    # Generate sine wave
+    t = np.arange(num_samples) / sample_rate
+    value = _sine(2 * np.pi * frequency * t)
 
-            # Fade in/out
-            fade_samples = int(num_samples * 0.15)
-            if i < fade_samples:
-                value *= i / fade_samples
-            elif i > num_samples - fade_samples:
-                value *= (num_samples - i) / fade_samples
+    # Apply fade in/out (10%)
+    if fade:
+        value *= _fade_envelope(num_samples, 0.1)
 
-            sample = int(value * 0.4 * 32767)
-            wav.writeframes(struct.pack('<h', sample))
+    return _write_wav(filename, value, volume, sample_rate)
 
-    print(f"Created: {filename}")
-
-def generate_stop_sound():
-    """Generate descending tone for stop"""
-    filename = SCRIPT_DIR / 'sounds' / 'stop.wav'
+def generate_sweep(filename, f_start, f_end, duration_ms=200, volume=0.4, fade_frac=0.15):
+    """Generate a linear frequency sweep from f_start to f_end Hz"""
     sample_rate = 44100
-    duration_ms = 200
     num_samples = int(sample_rate * duration_ms / 1000)
 
-    with wave.open(str(filename), 'w') as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(sample_rate)
-
-        for i in range(num_samples):
-            t = i / sample_rate
-            progress = i / num_samples
-
-            # Descending frequency (880Hz to 440Hz)
-            frequency = 880 - (880 - 440) * progress
-            value = math.sin(2 * math.pi * frequency * t)
-
-            # Fade in/out
-            fade_samples = int(num_samples * 0.15)
-            if i < fade_samples:
-                value *= i / fade_samples
-            elif i > num_samples - fade_samples:
-                value *= (num_samples - i) / fade_samples
+    # Phase-accumulate the ramping frequency so the sweep has no discontinuities
+    frequency = f_start + (f_end - f_start) * np.arange(num_samples) / num_samples
+    phase = 2 * np.pi * np.cumsum(frequency) / sample_rate
+    value = _sine(phase)
 
-            sample = int(value * 0.4 * 32767)
-            wav.writeframes(struct.pack('<h', sample))
+    # Fade in/out
+    value *= _fade_envelope(num_samples, fade_frac)
 
-    print(f"Created: {filename}")
+    if _write_wav(filename, value, volume, sample_rate):
+        print(f"Created: {filename}")
+    else:
+        print(f"Up to date: {filename}")
 
 def generate_icons():
     """Generate SVG icons for tray"""
@@ -121,8 +131,10 @@ def generate_icons():
 </svg>'''
 
     active_file = SCRIPT_DIR / 'icons' / 'mic-active.svg'
-    active_file.write_text(active_svg)
-    print(f"Created: {active_file}")
+    if _write_bytes(active_file, active_svg.encode('utf-8')):
+        print(f"Created: {active_file}")
+    else:
+        print(f"Up to date: {active_file}")
 
     # Idle icon - gray microphone
     idle_svg = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -136,8 +148,10 @@ def generate_icons():
 </svg>'''
 
     idle_file = SCRIPT_DIR / 'icons' / 'mic-idle.svg'
-    idle_file.write_text(idle_svg)
-    print(f"Created: {idle_file}")
+    if _write_bytes(idle_file, idle_svg.encode('utf-8')):
+        print(f"Created: {idle_file}")
+    else:
+        print(f"Up to date: {idle_file}")
 
 
 if __name__ == '__main__':
@@ -150,8 +164,8 @@ if __name__ == '__main__':
 
     # Generate sounds
     print("Generating sounds...")
-    generate_start_sound()
-    generate_stop_sound()
+    generate_sweep(SCRIPT_DIR / 'sounds' / 'start.wav', 440, 880)  # Ascending
+    generate_sweep(SCRIPT_DIR / 'sounds' / 'stop.wav', 880, 440)   # Descending
     print()
 
     # Generate icons
@@ -149,11 +149,17 @@ echo ""
 # Step 7: Test daemon
 echo -e "${YELLOW}Step 7: Testing daemon...${NC}"
 
-# Kill any existing daemon
-if [ -f /tmp/voice-daemon.pid ]; then
+# Stop any existing daemon and wait for it to release the PID file lock
+# (don't remove the file: a new daemon could lock a fresh copy while the
+# old one is still running)
+if [ -s /tmp/voice-daemon.pid ]; then
     OLD_PID=$(cat /tmp/voice-daemon.pid)
-    kill "$OLD_PID" 2>/dev/null || true
-    rm -f /tmp/voice-daemon.pid
+    if kill "$OLD_PID" 2>/dev/null; then
+        for _ in $(seq 50); do
+            kill -0 "$OLD_PID" 2>/dev/null || break
+            sleep 0.1
+        done
+    fi
 fi
 
 echo "Starting daemon for test..."
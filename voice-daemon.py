@@ -10,10 +10,17 @@ Voice Dictation Daemon with System Tray
 import sys
 import os
 import signal
+import socket
+import struct
 import subprocess
 import threading
 import time
+import wave
+import ctypes
+import ctypes.util
+import fcntl
 from pathlib import Path
+from shutil import which
 
 # Add script directory to path for imports
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -25,7 +32,7 @@ try:
         QApplication, QSystemTrayIcon, QMenu, QMessageBox
     )
     from PyQt6.QtGui import QIcon, QAction
-    from PyQt6.QtCore import QTimer, pyqtSignal, QObject
+    from PyQt6.QtCore import QTimer, pyqtSignal, QObject, QSocketNotifier
 except ImportError:
     print("ERROR: PyQt6 not found. Install with: pip install PyQt6")
     sys.exit(1)
@@ -37,6 +44,77 @@ except ImportError:
     print("ERROR: RealtimeSTT not found. Run: ./install.sh")
     sys.exit(1)
 
+# PyAudio (a RealtimeSTT dependency) plays the feedback sounds in-process;
+# without it we fall back to paplay/aplay
+try:
+    import pyaudio
+except ImportError:
+    pyaudio = None
+
+# dbus-python sends notifications over one session bus connection when
+# there's no tray to show them; without it we fall back to notify-send
+try:
+    import dbus
+except ImportError:
+    dbus = None
+
+# inotify constants (from <sys/inotify.h>)
+IN_ATTRIB = 0x00000004
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+# Text injectors to try, in order of preference, per XDG_SESSION_TYPE.
+# X11: xdotool is simple and needs no daemon. Wayland: ydotool (if ydotoold
+# is running), then wtype, then xdotool for X11-compatible apps.
+INJECTOR_CANDIDATES = {
+    'x11': ('xdotool',),
+    'wayland': ('ydotool', 'wtype', 'xdotool'),
+}
+DEFAULT_INJECTOR_CANDIDATES = ('xdotool',)
+INJECTOR_NAMES = frozenset({'xdotool', 'ydotool', 'wtype'})
+
+# How long to collect transcription updates before typing them
+TYPING_DEBOUNCE_MS = 75
+
+# Minimum interval between tray tooltip updates with the latest text (~4 Hz)
+TOOLTIP_INTERVAL_MS = 250
+
+# Linux input events (from <linux/input-event-codes.h>) for talking to
+# ydotoold directly. Keycodes assume a US layout, like `ydotool type`.
+INPUT_EVENT = struct.Struct('llHHi')  # struct input_event: timeval, type, code, value
+EV_SYN = 0x00
+EV_KEY = 0x01
+SYN_REPORT = 0
+KEY_LEFTSHIFT = 42
+
+
+def _build_keymap():
+    """Map characters to (keycode, needs_shift) for a US keyboard layout"""
+    keymap = {}
+    for row, first_code in (('1234567890', 2), ('qwertyuiop', 16),
+                            ('asdfghjkl', 30), ('zxcvbnm', 44)):
+        for i, char in enumerate(row):
+            keymap[char] = (first_code + i, False)
+            if char.isalpha():
+                keymap[char.upper()] = (first_code + i, True)
+
+    unshifted = {'-': 12, '=': 13, '\t': 15, '[': 26, ']': 27, '\n': 28,
+                 ';': 39, "'": 40, '`': 41, '\\': 43, ',': 51, '.': 52,
+                 '/': 53, ' ': 57}
+    shifted = {'!': 2, '@': 3, '#': 4, '$': 5, '%': 6, '^': 7, '&': 8,
+               '*': 9, '(': 10, ')': 11, '_': 12, '+': 13, '{': 26,
+               '}': 27, ':': 39, '"': 40, '~': 41, '|': 43, '<': 51,
+               '>': 52, '?': 53}
+    keymap.update({char: (code, False) for char, code in unshifted.items()})
+    keymap.update({char: (code, True) for char, code in shifted.items()})
+    return keymap
+
+
+KEYMAP = _build_keymap()
+
 
 class VoiceSignals(QObject):
     """Qt signals for thread-safe GUI updates"""
@@ -49,6 +127,10 @@ class VoiceDaemon:
     """Main voice dictation daemon"""
 
     def __init__(self):
+        # Single instance: take the PID file lock before anything heavy
+        self.pid_file = Path('/tmp/voice-daemon.pid')
+        self._pid_fd = self._lock_pid_file()
+
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
 
@@ -56,21 +138,39 @@ class VoiceDaemon:
         self.is_listening = False
         self.recorder = None
         self.listen_thread = None
+        self._recorder_ready = threading.Event()
+        self._listen_lock = threading.Lock()  # Only one loop may call recorder.text()
         self.shutdown_flag = False
-        self.last_typed_text = ""  # Track what we've already typed (for word-by-word)
+        self._typed_text = ""  # Text of the current phrase already typed (for word-by-word)
 
         # Configuration
         self.model = os.environ.get('VOICE_MODEL', 'small.en')
         self.language = os.environ.get('VOICE_LANGUAGE', 'en')
         self.word_by_word = os.environ.get('VOICE_WORD_BY_WORD', 'true').lower() == 'true'
 
+        # Inference device: GPU if available, otherwise quantized CPU
+        self.device, self.compute_type = self._select_device()
+
+        # Latency tuning (speed vs accuracy); defaults favour fast first words
+        self.beam_size = int(os.environ.get('VOICE_BEAM_SIZE', '1'))
+        self.beam_size_realtime = int(os.environ.get('VOICE_BEAM_SIZE_REALTIME', '1'))
+        self.realtime_model = os.environ.get(
+            'VOICE_REALTIME_MODEL', 'tiny.en' if self.model.endswith('.en') else 'tiny'
+        )
+        self.realtime_pause = float(os.environ.get('VOICE_REALTIME_PAUSE', '0.02'))
+        self.silence_duration = float(os.environ.get(
+            'VOICE_SILENCE_DURATION', '0.25' if self.word_by_word else '0.5'
+        ))
+
+        # Toggle file watching is legacy; SIGUSR1 is the supported toggle
+        self.file_toggle = os.environ.get('VOICE_ENABLE_FILE_TOGGLE', '') == '1'
+
         # Paths
         self.icon_active = SCRIPT_DIR / 'icons' / 'mic-active.svg'
         self.icon_idle = SCRIPT_DIR / 'icons' / 'mic-idle.svg'
         self.sound_start = SCRIPT_DIR / 'sounds' / 'start.wav'
         self.sound_stop = SCRIPT_DIR / 'sounds' / 'stop.wav'
         self.toggle_file = Path('/tmp/voice-daemon-toggle')
-        self.pid_file = Path('/tmp/voice-daemon.pid')
 
         # Signals for thread-safe updates
         self.signals = VoiceSignals()
@@ -78,29 +178,94 @@ class VoiceDaemon:
         self.signals.status_changed.connect(self.on_status_changed)
         self.signals.error_occurred.connect(self.on_error)
 
+        # Recorder threads queue text for the typing thread directly; only
+        # the tray tooltip goes through the Qt event loop, throttled
+        self._pending_text = ""
+        self._typing_cond = threading.Condition()
+        self._typing_stop = False
+        self._tooltip_text = ""
+        self._tooltip_pending = False
+        self._tooltip_timer = QTimer()
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.timeout.connect(self._update_tooltip)
+
         # Detect text injection method
         self.text_injector = self._detect_text_injector()
 
+        # Resolve helper commands once instead of searching PATH on every use
+        self._injector_path = which(self.text_injector) if self.text_injector else None
+        self._paplay_path = which('paplay')
+        self._aplay_path = which('aplay')
+
+        # Notifications go through the tray; D-Bus or notify-send is only
+        # needed when there's no notification-capable tray (e.g. no
+        # StatusNotifierHost)
+        self._tray_messages = QSystemTrayIcon.supportsMessages()
+        self._dbus_notify = None if self._tray_messages else self._connect_notifications()
+        self._notify_send_path = (
+            None if self._tray_messages or self._dbus_notify else which('notify-send')
+        )
+
+        # Injector command line minus the text, built once
+        self._inject_prefix = {
+            'ydotool': [self._injector_path, 'type', '--'],
+            'xdotool': [self._injector_path, 'type', '--'],
+            'wtype': [self._injector_path],
+        }.get(self.text_injector)
+        self._type_child = None  # Injector process still typing, if any
+        self._devnull_fd = os.open(os.devnull, os.O_WRONLY)  # Shared by all helpers
+        self._children = []  # Fire-and-forget helpers (sounds, notifications)
+
+        # Talk to ydotoold directly instead of spawning ydotool per phrase
+        self._ydotool_sock = self._connect_ydotoold() if self.text_injector == 'ydotool' else None
+
+        # Decode the feedback sounds once so playing them is just a write
+        self._setup_sound_output()
+
         # Setup tray
         self._setup_tray()
 
-        # Setup toggle file watcher
-        self._setup_toggle_watcher()
-
-        # Write PID file
-        self._write_pid()
+        # Setup toggle file watcher (opt-in)
+        self.toggle_fd = -1
+        self.toggle_notifier = None
+        if self.file_toggle:
+            self._setup_toggle_watcher()
 
         # Handle signals
+        self._setup_signal_wakeup()
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGUSR1, self._toggle_signal_handler)
 
         print(f"Voice Daemon started")
         print(f"  Model: {self.model}")
+        print(f"  Device: {self.device} ({self.compute_type})")
         print(f"  Mode: {'word-by-word' if self.word_by_word else 'phrase-by-phrase'}")
         print(f"  Text injector: {self.text_injector}")
         print(f"  PID: {os.getpid()}")
-        print(f"  Toggle: kill -USR1 {os.getpid()} or touch {self.toggle_file}")
+        if self.toggle_notifier:
+            print(f"  Toggle: kill -USR1 {os.getpid()} or touch {self.toggle_file}")
+        else:
+            print(f"  Toggle: kill -USR1 {os.getpid()}")
+
+        # Load the model now so the first toggle doesn't wait for it
+        threading.Thread(target=self._preload_recorder, daemon=True).start()
+
+        self.typing_thread = threading.Thread(target=self._typing_loop, daemon=True)
+        self.typing_thread.start()
+
+    def _select_device(self):
+        """Pick the inference device and compute type (VOICE_DEVICE/VOICE_COMPUTE_TYPE override)"""
+        device = os.environ.get('VOICE_DEVICE')
+        if not device:
+            try:
+                import torch  # Already loaded by RealtimeSTT
+                device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            except Exception:
+                device = 'cpu'
+
+        default_compute_type = 'int8_float16' if device == 'cuda' else 'int8'
+        return device, os.environ.get('VOICE_COMPUTE_TYPE', default_compute_type)
 
     def _detect_text_injector(self):
         """Detect available text injection method based on session type"""
@@ -108,37 +273,25 @@ class VoiceDaemon:
         session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
         print(f"  Session type: {session_type}")
 
-        # On X11, prefer xdotool (simple, no daemon needed)
-        if session_type == 'x11':
-            if self._command_exists('xdotool'):
-                return 'xdotool'
+        # One pass over $PATH finds every candidate at once
+        available = self._find_commands(INJECTOR_NAMES)
 
-        # On Wayland, try ydotool first (needs ydotoold daemon)
-        if session_type == 'wayland':
-            if self._command_exists('ydotool'):
-                # Check if ydotoold is running
-                try:
-                    result = subprocess.run(
-                        ['pgrep', '-x', 'ydotoold'],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode == 0:
-                        return 'ydotool'
-                except:
-                    pass
+        for cmd in INJECTOR_CANDIDATES.get(session_type, DEFAULT_INJECTOR_CANDIDATES):
+            if cmd not in available:
+                continue
+
+            # On Wayland, ydotool needs the ydotoold daemon
+            if cmd == 'ydotool' and session_type == 'wayland':
+                if self._proc_running('ydotoold'):
+                    return 'ydotool'
                 print("  Note: ydotool found but ydotoold not running")
                 print("  Start with: sudo ydotoold &")
+                continue
 
-            # Fallback to wtype for Wayland
-            if self._command_exists('wtype'):
-                return 'wtype'
-
-        # Generic fallback - try xdotool (works if X11 compatibility exists)
-        if self._command_exists('xdotool'):
-            return 'xdotool'
+            return cmd
 
         # Last resort - try ydotool
-        if self._command_exists('ydotool'):
+        if 'ydotool' in available:
             return 'ydotool'
 
         print("WARNING: No text injection tool found!")
@@ -146,11 +299,119 @@ class VoiceDaemon:
         print("  For Wayland: sudo pacman -S ydotool && sudo ydotoold &")
         return None
 
-    def _command_exists(self, cmd):
-        """Check if command exists"""
-        return subprocess.run(
-            ['which', cmd], capture_output=True
-        ).returncode == 0
+    @staticmethod
+    def _find_commands(names):
+        """Return the subset of names that are executables on $PATH"""
+        found = set()
+        for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+            try:
+                with os.scandir(directory or '.') as entries:
+                    for entry in entries:
+                        if (entry.name in names and entry.name not in found
+                                and os.access(entry.path, os.X_OK)):
+                            found.add(entry.name)
+            except OSError:
+                continue
+        return found
+
+    @staticmethod
+    def _proc_running(name):
+        """Check for a process named name by reading /proc/<pid>/comm (like pgrep -x)"""
+        try:
+            pids = [entry.name for entry in os.scandir('/proc') if entry.name.isdigit()]
+        except OSError:
+            return False
+
+        for pid in pids:
+            try:
+                with open(f'/proc/{pid}/comm') as f:
+                    if f.read().rstrip('\n') == name:
+                        return True
+            except OSError:
+                continue  # Process exited while scanning
+        return False
+
+    def _connect_ydotoold(self, quiet=False):
+        """
+        Open a persistent connection to the ydotoold socket (ydotool >= 1.0)
+
+        Args:
+            quiet: Don't report the outcome (used when reconnecting)
+
+        Returns:
+            Connected socket, or None if ydotoold isn't reachable
+        """
+        candidates = []
+        if os.environ.get('YDOTOOL_SOCKET'):
+            candidates.append(os.environ['YDOTOOL_SOCKET'])
+        if os.environ.get('XDG_RUNTIME_DIR'):
+            candidates.append(os.path.join(os.environ['XDG_RUNTIME_DIR'], '.ydotool_socket'))
+        candidates.append('/tmp/.ydotool_socket')
+
+        for path in candidates:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.connect(path)
+                if not quiet:
+                    print(f"  ydotoold socket: {path}")
+                return sock
+            except OSError:
+                sock.close()
+
+        if not quiet:
+            print("  Note: ydotoold socket not reachable, using ydotool command")
+        return None
+
+    def _ydotool_type(self, text):
+        """
+        Type text by writing key events to the ydotoold socket
+
+        Returns:
+            Number of leading characters typed: len(text) on success, 0 if
+            the text contains characters without a keycode, or the count
+            typed before the socket failed. The caller types the rest with
+            the ydotool command.
+        """
+        try:
+            keys = [KEYMAP[char] for char in text]
+        except KeyError:
+            return 0
+
+        def event(ev_type, code, value):
+            return INPUT_EVENT.pack(0, 0, ev_type, code, value)
+
+        syn = event(EV_SYN, SYN_REPORT, 0)
+        shift_down = [event(EV_KEY, KEY_LEFTSHIFT, 1), syn]
+        shift_up = [event(EV_KEY, KEY_LEFTSHIFT, 0), syn]
+
+        typed = 0
+        for code, shift in keys:
+            pressed = []  # Release events owed if sending fails midway
+            try:
+                # ydotoold reads one input_event per datagram
+                if shift:
+                    pressed = shift_up
+                    for ev in shift_down:
+                        self._ydotool_sock.send(ev)
+                self._ydotool_sock.send(event(EV_KEY, code, 1))
+                typed += 1  # The key press produces the character
+                pressed = [event(EV_KEY, code, 0), syn] + pressed
+                for ev in pressed:
+                    self._ydotool_sock.send(ev)
+            except OSError as e:
+                print(f"ydotoold socket error ({e}), typing the rest with the ydotool command")
+                # Best effort: don't leave a key (or Shift) held down
+                for ev in pressed:
+                    try:
+                        self._ydotool_sock.send(ev)
+                    except OSError:
+                        break
+                # Reconnected on the next call, e.g. after ydotoold restarts
+                self._ydotool_sock.close()
+                self._ydotool_sock = None
+                break
+
+        return typed
 
     def _setup_tray(self):
         """Setup system tray icon"""
@@ -207,25 +468,110 @@ class VoiceDaemon:
             self.toggle_listening()
 
     def _setup_toggle_watcher(self):
-        """Setup file watcher for toggle"""
+        """Setup inotify watcher for the toggle file"""
         # Clean up old toggle file
         if self.toggle_file.exists():
             self.toggle_file.unlink()
 
-        # Timer to check for toggle file
-        self.toggle_timer = QTimer()
-        self.toggle_timer.timeout.connect(self._check_toggle_file)
-        self.toggle_timer.start(200)  # Check every 200ms
+        # Watch the directory (the file doesn't exist yet) and let Qt wake us
+        # when the inotify fd becomes readable - no polling
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+            wd = libc.inotify_add_watch(
+                fd,
+                str(self.toggle_file.parent).encode(),
+                IN_CREATE | IN_MOVED_TO | IN_ATTRIB
+            )
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, 'inotify_add_watch failed')
+        except (OSError, AttributeError) as e:
+            print(f"  Note: toggle file watcher unavailable ({e}), use kill -USR1")
+            return
+
+        self.toggle_fd = fd
+        self.toggle_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read)
+        self.toggle_notifier.activated.connect(self._on_toggle_dir_event)
 
-    def _check_toggle_file(self):
-        """Check if toggle file was created"""
-        if self.toggle_file.exists():
+    def _on_toggle_dir_event(self):
+        """Handle inotify events for the toggle file's directory"""
+        toggle_name = self.toggle_file.name.encode()
+        triggered = False
+
+        # Drain all pending events, only reacting to our file
+        while True:
+            try:
+                data = os.read(self.toggle_fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                _, _, _, name_len = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = data[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                if name == toggle_name:
+                    triggered = True
+
+        if triggered and self.toggle_file.exists():
             self.toggle_file.unlink()
             self.toggle_listening()
 
-    def _write_pid(self):
-        """Write PID to file"""
-        self.pid_file.write_text(str(os.getpid()))
+    def _lock_pid_file(self):
+        """
+        Open and lock the PID file and write our PID, exiting if another
+        daemon holds it
+
+        The kernel drops the flock when the process exits, so a crashed
+        daemon never leaves a stale lock behind. The PID is written right
+        after locking so a concurrent start never reads a stale one.
+
+        Returns:
+            The locked PID file descriptor
+        """
+        fd = os.open(self.pid_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pid = os.read(fd, 32).decode(errors='replace').strip()
+            os.close(fd)
+            print(f"Daemon already running (PID: {pid})")
+            print(f"To toggle: kill -USR1 {pid}")
+            print(f"To stop: kill {pid}")
+            sys.exit(1)
+
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, str(os.getpid()).encode(), 0)
+        return fd
+
+    def _setup_signal_wakeup(self):
+        """Wake the Qt event loop when a signal arrives"""
+        # Python only runs signal handlers when the main thread executes
+        # bytecode, which an idle app.exec() never does. The C-level handler
+        # writes to this socket, and the notifier gives Python a turn.
+        self._signal_rsock, self._signal_wsock = socket.socketpair()
+        self._signal_rsock.setblocking(False)
+        self._signal_wsock.setblocking(False)
+        signal.set_wakeup_fd(self._signal_wsock.fileno(), warn_on_full_buffer=False)
+
+        self.signal_notifier = QSocketNotifier(self._signal_rsock.fileno(), QSocketNotifier.Type.Read)
+        self.signal_notifier.activated.connect(self._on_signal_wakeup)
+
+    def _on_signal_wakeup(self):
+        """Drain the wakeup socket; the Python handlers run on return"""
+        try:
+            while self._signal_rsock.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -284,14 +630,13 @@ class VoiceDaemon:
         # Show notification
         self._notify("Voice Dictation", "Stopped listening")
 
-        # Shutdown recorder
+        # Interrupt the pending text() call; the recorder itself stays
+        # loaded for the next toggle and is only shut down in quit()
         if self.recorder:
             try:
                 self.recorder.abort()
-                self.recorder.shutdown()
             except:
                 pass
-            self.recorder = None
 
         print("Stopped listening")
 
@@ -300,20 +645,40 @@ class VoiceDaemon:
         if self.shutdown_flag or not self.is_listening:
             return
 
-        # Type only the new words that weren't already typed
-        if text.startswith(self.last_typed_text):
-            new_text = text[len(self.last_typed_text):].lstrip()
+        # Type only the new words that weren't already typed. Each update
+        # re-transcribes the whole phrase, so Whisper may revise words we
+        # already typed; only an update that extends the typed text exactly
+        # is used (startswith is a single memcmp, and the slice is the only
+        # new string per update).
+        if len(text) > len(self._typed_text) and text.startswith(self._typed_text):
+            new_text = text[len(self._typed_text):].lstrip()
             if new_text:
-                self.signals.text_ready.emit(new_text)
-                self.last_typed_text = text
+                self._queue_text(new_text)
+                self._typed_text = text
 
-    def _listen_loop(self):
-        """Main listening loop (runs in thread)"""
+    def _on_final_text(self, text):
+        """Callback for a finished phrase transcription (phrase-by-phrase)"""
+        if self.shutdown_flag:
+            return
+
+        if text and text.strip():
+            self._queue_text(text.strip())
+
+    def _preload_recorder(self):
+        """Create the recorder and load the model (runs in thread at startup)"""
         try:
-            # Reset typed text tracker
-            self.last_typed_text = ""
+            # Small beams and a tiny model for the partial (realtime) decodes
+            # keep per-update decoder time low
+            tuning = dict(
+                device=self.device,
+                compute_type=self.compute_type,
+                beam_size=self.beam_size,
+                beam_size_realtime=self.beam_size_realtime,
+                realtime_model_type=self.realtime_model,
+                realtime_processing_pause=self.realtime_pause,
+                post_speech_silence_duration=self.silence_duration,
+            )
 
-            # Initialize recorder
             if self.word_by_word:
                 # Word-by-word mode: use realtime callback
                 self.recorder = AudioToTextRecorder(
@@ -323,70 +688,130 @@ class VoiceDaemon:
                     on_realtime_transcription_update=self._on_realtime_update,
                     silero_sensitivity=0.5,
                     webrtc_sensitivity=3,
-                    post_speech_silence_duration=0.3,  # Shorter for faster word detection
                     min_length_of_recording=0.3,
                     min_gap_between_recordings=0,
                     spinner=False,
+                    **tuning,
                 )
             else:
-                # Phrase-by-phrase mode: use blocking text()
+                # Phrase-by-phrase mode: use text() with a completion callback
                 self.recorder = AudioToTextRecorder(
                     model=self.model,
                     language=self.language,
                     enable_realtime_transcription=True,
                     silero_sensitivity=0.5,
                     webrtc_sensitivity=3,
-                    post_speech_silence_duration=0.6,  # Longer pause for phrase detection
                     min_length_of_recording=0.5,
                     min_gap_between_recordings=0.1,
                     spinner=False,
+                    **tuning,
                 )
 
-            print(f"Recorder initialized, listening... (mode: {'word-by-word' if self.word_by_word else 'phrase-by-phrase'})")
+            print(f"Recorder initialized (mode: {'word-by-word' if self.word_by_word else 'phrase-by-phrase'})")
 
-            if self.word_by_word:
-                # Word-by-word: keep recorder alive and let callback handle typing
-                while self.is_listening and not self.shutdown_flag:
-                    # Just keep the loop alive, callback does the work
-                    text = self.recorder.text()  # This blocks until speech ends
-                    # Reset for next phrase
-                    self.last_typed_text = ""
-            else:
-                # Phrase-by-phrase: wait for complete phrases
-                while self.is_listening and not self.shutdown_flag:
-                    try:
-                        text = self.recorder.text()
+        except Exception as e:
+            self.signals.error_occurred.emit(f"Recorder init failed: {e}")
 
-                        if self.shutdown_flag:
-                            break
+        finally:
+            self._recorder_ready.set()
 
-                        if text and text.strip():
-                            self.signals.text_ready.emit(text.strip())
+    def _listen_loop(self):
+        """Main listening loop (runs in thread)"""
+        # Wait for the model if the user toggled on during startup
+        self._recorder_ready.wait()
 
-                    except Exception as e:
-                        if not self.shutdown_flag:
-                            self.signals.error_occurred.emit(str(e))
-                        break
+        with self._listen_lock:
+            try:
+                if not self.recorder:
+                    # Startup load failed (e.g. no mic at login); retry now,
+                    # reporting the error again if it still fails
+                    print("Retrying recorder initialization...")
+                    self._preload_recorder()
+                    if not self.recorder:
+                        return
+
+                # Reset typed text tracker
+                self._typed_text = ""
+
+                print("Listening...")
+
+                if self.word_by_word:
+                    # Word-by-word: keep recorder alive and let callback handle typing
+                    while self.is_listening and not self.shutdown_flag:
+                        # Just keep the loop alive, callback does the work
+                        text = self.recorder.text()  # This blocks until speech ends
+                        # Reset for next phrase
+                        self._typed_text = ""
+                else:
+                    # Phrase-by-phrase: text() blocks until the phrase ends
+                    # and is transcribed; stop_listening() abort()s the wait
+                    while self.is_listening and not self.shutdown_flag:
+                        try:
+                            self._on_final_text(self.recorder.text())
+
+                        except Exception as e:
+                            if not self.shutdown_flag:
+                                self.signals.error_occurred.emit(str(e))
+                            break
 
-        except Exception as e:
-            self.signals.error_occurred.emit(f"Recorder init failed: {e}")
+            except Exception as e:
+                if not self.shutdown_flag:
+                    self.signals.error_occurred.emit(str(e))
 
-        finally:
-            if self.recorder:
-                try:
-                    self.recorder.shutdown()
-                except:
-                    pass
-                self.recorder = None
+            finally:
+                # Update state in main thread
+                if self.is_listening:
+                    self.signals.status_changed.emit(False)
 
-            # Update state in main thread
-            if self.is_listening:
-                self.signals.status_changed.emit(False)
+    def _queue_text(self, text):
+        """Hand transcribed text to the typing thread (recorder threads)"""
+        print(f"Transcribed: {text}")
+
+        with self._typing_cond:
+            self._pending_text += text
+            self._typing_cond.notify()
+
+        # Show the latest text in the tray; at most one GUI signal is in
+        # flight until _update_tooltip picks it up
+        self._tooltip_text = text
+        if not self._tooltip_pending:
+            self._tooltip_pending = True
+            self.signals.text_ready.emit(text)
+
+    def _typing_loop(self):
+        """Type queued text into the focused window (runs in thread)"""
+        while True:
+            with self._typing_cond:
+                while not self._pending_text and not self._typing_stop:
+                    self._typing_cond.wait()
+                if not self._pending_text:
+                    return  # Stopped and nothing left to type
+
+            # Batch updates arriving within the debounce window so fast
+            # speech costs one injector call instead of one per word
+            if not self._typing_stop:
+                time.sleep(TYPING_DEBOUNCE_MS / 1000)
+
+            with self._typing_cond:
+                text, self._pending_text = self._pending_text, ""
+            self._type_text(text)
+
+            # Let the injector finish (collecting more text meanwhile) so
+            # keystrokes from two processes never interleave
+            if self._type_child:
+                self._type_child.wait()
+                self._type_child = None
 
     def on_text_ready(self, text):
-        """Handle transcribed text (main thread)"""
-        print(f"Transcribed: {text}")
-        self._type_text(text)
+        """Schedule a throttled tray tooltip update (main thread)"""
+        if not self._tooltip_timer.isActive():
+            self._tooltip_timer.start(TOOLTIP_INTERVAL_MS)
+
+    def _update_tooltip(self):
+        """Show the most recent transcription in the tray tooltip"""
+        self._tooltip_pending = False
+        if self.is_listening:
+            self.tray.setToolTip(f"Voice Dictation - LISTENING\n{self._tooltip_text}")
 
     def on_status_changed(self, is_listening):
         """Handle status change from thread"""
@@ -406,63 +831,147 @@ class VoiceDaemon:
             return
 
         try:
+            # ydotool works on both X11 and Wayland; prefer its daemon socket
+            typed = 0
             if self.text_injector == 'ydotool':
-                # ydotool works on both X11 and Wayland
-                subprocess.run(['ydotool', 'type', '--', text], check=True)
-
-            elif self.text_injector == 'xdotool':
-                # xdotool for X11
-                subprocess.run(['xdotool', 'type', '--', text], check=True)
+                if not self._ydotool_sock:
+                    # ydotoold may have (re)started since the last attempt
+                    self._ydotool_sock = self._connect_ydotoold(quiet=True)
+                if self._ydotool_sock:
+                    typed = self._ydotool_type(text)
 
-            elif self.text_injector == 'wtype':
-                # wtype for Wayland
-                subprocess.run(['wtype', text], check=True)
+            if typed < len(text):
+                # _typing_loop waits for it before typing the next batch
+                self._type_child = self._popen(self._inject_prefix + [text[typed:]])
 
             print(f"Typed: {text}")
 
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to type text: {e}")
         except Exception as e:
             print(f"Type error: {e}")
 
+    def _spawn(self, cmd):
+        """Start a helper process without waiting for it"""
+        # Reap helpers that have exited since the last spawn, so finished
+        # processes don't linger as zombies for the whole session
+        self._children = [child for child in self._children if child.poll() is None]
+
+        self._children.append(self._popen(cmd))
+
+    def _popen(self, cmd):
+        """Start cmd with output discarded, via posix_spawn where possible"""
+        # A preopened /dev/null fd and close_fds=False let subprocess use
+        # posix_spawn instead of forking this (model-sized) process. Our own
+        # fds are non-inheritable (PEP 446), so none leak into the child.
+        return subprocess.Popen(
+            cmd,
+            stdout=self._devnull_fd,
+            stderr=self._devnull_fd,
+            close_fds=False
+        )
+
+    def _setup_sound_output(self):
+        """Pre-decode the start/stop sounds for in-process playback"""
+        self._pyaudio = None
+        self._sound_pcm = {}  # sound file -> (channels, sample width, rate, frames)
+        self._sound_lock = threading.Lock()  # One sound at a time
+
+        if pyaudio is None:
+            return
+
+        try:
+            for sound_file in (self.sound_start, self.sound_stop):
+                if sound_file.exists():
+                    with wave.open(str(sound_file), 'rb') as wav:
+                        self._sound_pcm[sound_file] = (
+                            wav.getnchannels(),
+                            wav.getsampwidth(),
+                            wav.getframerate(),
+                            wav.readframes(wav.getnframes()),
+                        )
+            self._pyaudio = pyaudio.PyAudio()
+        except Exception as e:
+            print(f"  Note: in-process sound playback unavailable ({e}), using paplay/aplay")
+            self._sound_pcm = {}
+
+    def _play_pcm(self, channels, sample_width, rate, frames):
+        """Play decoded PCM on the default output device (runs in thread)"""
+        with self._sound_lock:
+            if not self._pyaudio:
+                return  # Daemon is quitting
+
+            try:
+                stream = self._pyaudio.open(
+                    format=self._pyaudio.get_format_from_width(sample_width),
+                    channels=channels,
+                    rate=rate,
+                    output=True
+                )
+                try:
+                    stream.write(frames)
+                finally:
+                    stream.stop_stream()
+                    stream.close()
+            except Exception as e:
+                print(f"Sound playback error: {e}")
+
     def _play_sound(self, sound_file):
         """Play sound file"""
+        # Pre-decoded: play in-process off the GUI thread
+        if self._pyaudio and sound_file in self._sound_pcm:
+            threading.Thread(
+                target=self._play_pcm,
+                args=self._sound_pcm[sound_file],
+                daemon=True
+            ).start()
+            return
+
         if not sound_file.exists():
             return
 
         try:
             # Try paplay (PulseAudio) first
-            if self._command_exists('paplay'):
-                subprocess.Popen(
-                    ['paplay', str(sound_file)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+            if self._paplay_path:
+                self._spawn([self._paplay_path, str(sound_file)])
             # Fallback to aplay
-            elif self._command_exists('aplay'):
-                subprocess.Popen(
-                    ['aplay', '-q', str(sound_file)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+            elif self._aplay_path:
+                self._spawn([self._aplay_path, '-q', str(sound_file)])
         except:
             pass
 
+    def _connect_notifications(self):
+        """
+        Get the freedesktop Notify method on a persistent session bus
+
+        Returns:
+            Callable D-Bus method, or None if dbus-python or the bus is unavailable
+        """
+        if dbus is None:
+            return None
+
+        try:
+            bus = dbus.SessionBus()
+            notifications = bus.get_object(
+                'org.freedesktop.Notifications', '/org/freedesktop/Notifications'
+            )
+            return notifications.get_dbus_method('Notify', 'org.freedesktop.Notifications')
+        except Exception as e:
+            print(f"  Note: D-Bus notifications unavailable ({e}), using notify-send")
+            return None
+
     def _notify(self, title, message):
         """Show desktop notification"""
+        # One notification per event: tray message, or D-Bus/notify-send without one
         try:
-            if self._command_exists('notify-send'):
-                subprocess.Popen(
-                    ['notify-send', '-a', 'Voice Dictation', title, message],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
+            if self._tray_messages:
+                self.tray.showMessage(title, message, QSystemTrayIcon.MessageIcon.Information, 2000)
+            elif self._dbus_notify:
+                self._dbus_notify(
+                    'Voice Dictation', dbus.UInt32(0), '', title, message,
+                    dbus.Array([], signature='s'), dbus.Dictionary({}, signature='sv'),
+                    2000
                 )
-        except:
-            pass
-
-        # Also show tray message
-        try:
-            self.tray.showMessage(title, message, QSystemTrayIcon.MessageIcon.Information, 2000)
+            elif self._notify_send_path:
+                self._spawn([self._notify_send_path, '-a', 'Voice Dictation', title, message])
         except:
             pass
 
@@ -471,11 +980,52 @@ class VoiceDaemon:
         self.shutdown_flag = True
         self.stop_listening()
 
-        # Cleanup
-        if self.pid_file.exists():
-            self.pid_file.unlink()
-        if self.toggle_file.exists():
-            self.toggle_file.unlink()
+        # Type anything still waiting in the debounce window
+        self._tooltip_timer.stop()
+        with self._typing_cond:
+            self._typing_stop = True
+            self._typing_cond.notify()
+        self.typing_thread.join(timeout=5)
+
+        if self._devnull_fd >= 0:
+            os.close(self._devnull_fd)
+            self._devnull_fd = -1
+
+        if self._ydotool_sock:
+            self._ydotool_sock.close()
+            self._ydotool_sock = None
+
+        if self._pyaudio:
+            with self._sound_lock:
+                self._pyaudio.terminate()
+                self._pyaudio = None
+
+        if self.recorder:
+            try:
+                self.recorder.shutdown()
+            except:
+                pass
+            self.recorder = None
+
+        # Cleanup: empty the PID file and release the lock. The file isn't
+        # unlinked, since another starter may already have it open and
+        # would then lock a different inode than the next one.
+        if self._pid_fd >= 0:
+            os.ftruncate(self._pid_fd, 0)
+            os.close(self._pid_fd)
+            self._pid_fd = -1
+        if self.signal_notifier:
+            signal.set_wakeup_fd(-1)
+            self.signal_notifier.setEnabled(False)
+            self.signal_notifier = None
+            self._signal_rsock.close()
+            self._signal_wsock.close()
+        if self.toggle_notifier:
+            if self.toggle_file.exists():
+                self.toggle_file.unlink()
+            self.toggle_notifier.setEnabled(False)
+            self.toggle_notifier = None
+            os.close(self.toggle_fd)
 
         self.tray.hide()
         self.app.quit()
@@ -496,21 +1046,7 @@ def main():
     if args.model:
         os.environ['VOICE_MODEL'] = args.model
 
-    # Check if already running
-    pid_file = Path('/tmp/voice-daemon.pid')
-    if pid_file.exists():
-        try:
-            pid = int(pid_file.read_text().strip())
-            # Check if process is running
-            os.kill(pid, 0)
-            print(f"Daemon already running (PID: {pid})")
-            print(f"To toggle: kill -USR1 {pid}")
-            print(f"To stop: kill {pid}")
-            sys.exit(1)
-        except (ProcessLookupError, ValueError):
-            # Process not running, clean up stale PID file
-            pid_file.unlink()
-
+    # VoiceDaemon exits if another instance holds the PID file lock
     daemon = VoiceDaemon()
     sys.exit(daemon.run())
 
@@ -6,8 +6,8 @@ PID_FILE="/tmp/voice-daemon.pid"
 TOGGLE_FILE="/tmp/voice-daemon-toggle"
 SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 
-# Check if daemon is running
-if [ -f "$PID_FILE" ]; then
+# Check if daemon is running (the PID file is left empty on exit)
+if [ -s "$PID_FILE" ]; then
     PID=$(cat "$PID_FILE")
 
     # Verify process is actually running
@@ -18,8 +18,9 @@ if [ -f "$PID_FILE" ]; then
     fi
 fi
 
-# Daemon not running - try toggle file method (in case of permission issues)
-if [ -f "$PID_FILE" ]; then
+# Signal failed - try toggle file method (in case of permission issues).
+# Only works if the daemon was started with VOICE_ENABLE_FILE_TOGGLE=1
+if [ -s "$PID_FILE" ] && [ "$VOICE_ENABLE_FILE_TOGGLE" = "1" ]; then
     touch "$TOGGLE_FILE"
     exit 0
 fi
@@ -37,7 +38,7 @@ nohup python3 voice-daemon.py > /tmp/voice-daemon.log 2>&1 &
 sleep 2
 
 # Check if started successfully
-if [ -f "$PID_FILE" ]; then
+if [ -s "$PID_FILE" ]; then
     PID=$(cat "$PID_FILE")
     if kill -0 "$PID" 2>/dev/null; then
         notify-send "Voice Dictation" "Daemon started! Press Super+F12 again to toggle." 2>/dev/null || true